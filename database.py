@@ -1,31 +1,68 @@
 import sqlite3
-from sqlmodel import create_engine, Session, SQLModel
-from sqlalchemy import event, Engine
-from dotenv import load_dotenv
+from contextlib import ExitStack
+from inicializacao import perfil
+
+with perfil.medir("import:database/sqlmodel"):
+    from sqlmodel import create_engine, Session, SQLModel
+    from sqlalchemy import event, Engine, select, text
+
+with perfil.medir("import:database/dotenv"):
+    from dotenv import load_dotenv
 import logging
 import os
 
 # Carregar variáveis do arquivo .env
-load_dotenv()
+with perfil.medir("import:database/load_dotenv"):
+    load_dotenv()
 
 # Configurar o logger
-logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+with perfil.medir("import:database/logging"):
+    logging.basicConfig()
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
 # Configuração do banco de dados
-engine = create_engine(os.getenv( "SQLITE_URL" ))
+with perfil.medir("import:database/create_engine"):
+    engine = create_engine(os.getenv( "SQLITE_URL" ))
+
+# Versão do esquema gravada em PRAGMA user_version (SQLite).
+# Incrementar ao criar um novo modelo (tabela): o create_all só cria tabelas inexistentes.
+# Alterações em tabelas existentes (ex.: nova coluna) não são aplicadas e exigem uma migração.
+SCHEMA_VERSION = 1
 
 # Criar a(s) tabela(s) no banco de dados
-# Inicializa o banco de dados
+# Inicializa o banco de dados apenas se a versão do esquema estiver desatualizada,
+# evitando que o create_all consulte o catálogo tabela por tabela a cada inicialização
 def create_db_and_tables() -> None:
+    if engine.dialect.name != "sqlite":
+        SQLModel.metadata.create_all(engine)
+        return
+    with engine.connect() as conn:
+        versao = conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+    # Uma versão maior indica que um build mais novo já preparou o banco
+    if versao >= SCHEMA_VERSION:
+        return
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION:d}")
 
 def get_session() -> Session:
     return Session(engine)
 
+# Abre todas as conexões do pool ao mesmo tempo (para que nenhuma seja reutilizada)
+# e lê cada tabela uma vez, para que as primeiras requisições não paguem a conexão nem o cache frio
+def aquecer_banco() -> None:
+    tamanho_pool = getattr(engine.pool, "size", lambda: 1)()
+
+    with ExitStack() as pilha:
+        conexoes = [pilha.enter_context(engine.connect()) for _ in range(tamanho_pool)]
+        for conn in conexoes:
+            conn.execute(text("SELECT 1"))
+        for tabela in SQLModel.metadata.sorted_tables:
+            conexoes[0].execute(select(tabela).limit(1)).all()
+
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     if type(dbapi_connection) is sqlite3.Connection:  # somente para o SQLite
        cursor = dbapi_connection.cursor()
        cursor.execute("PRAGMA foreign_keys=ON")
-       cursor.close()
\ No newline at end of file
+       cursor.close()
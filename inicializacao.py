@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+import logging
+import time
+
+# Handler próprio: as fases de import são registradas antes do logging.basicConfig()
+# em database.py, e sem ele essas mensagens seriam descartadas
+_handler = logging.StreamHandler()
+_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+logger = logging.getLogger("mfmovies.inicializacao")
+logger.setLevel(logging.INFO)
+logger.addHandler(_handler)
+logger.propagate = False
+
+# Registra a duração de cada fase da inicialização (imports, lifespan, aquecimento).
+# Subfases usam "/" no nome (ex.: import:database/sqlmodel) e já estão contidas na fase pai;
+# para totalizar, some apenas as fases sem "/".
+class PerfilInicializacao:
+    def __init__(self) -> None:
+        self.inicio = time.perf_counter()
+        self.fases: dict[str, float] = {}
+        self.pronto = False
+        self.total_ate_pronto: float | None = None
+        self.erro: str | None = None
+
+    @contextmanager
+    def medir(self, fase: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases[fase] = round((time.perf_counter() - inicio) * 1000, 2)
+            logger.info("%s: %.2f ms", fase, self.fases[fase])
+
+    def registrar_erro(self, erro: Exception) -> None:
+        self.erro = f"{type(erro).__name__}: {erro}"
+
+    def marcar_pronto(self) -> None:
+        self.pronto = True
+        self.erro = None
+        self.total_ate_pronto = round((time.perf_counter() - self.inicio) * 1000, 2)
+        logger.info("Aplicação pronta em %.2f ms", self.total_ate_pronto)
+
+    def relatorio(self) -> dict:
+        return {
+            "pronto": self.pronto,
+            "erro": self.erro,
+            "total_ate_pronto_ms": self.total_ate_pronto,
+            "fases_ms": dict(self.fases),
+        }
+
+perfil = PerfilInicializacao()
@@ -1,13 +1,78 @@
-from fastapi import FastAPI
-from contextlib import asynccontextmanager
-from database import create_db_and_tables
-from rotas import avaliacoes, filmes, home, listaFavoritos, usuarios
+from inicializacao import perfil
+
+with perfil.medir("import:stdlib"):
+    import asyncio
+    import logging
+    from contextlib import asynccontextmanager
+
+with perfil.medir("import:fastapi"):
+    from fastapi import FastAPI
+    from fastapi.concurrency import run_in_threadpool
+
+with perfil.medir("import:database"):
+    from database import aquecer_banco, create_db_and_tables, get_session
+
+with perfil.medir("import:outbox"):
+    from outbox import compactar_alteracoes
+
+with perfil.medir("import:rotas.home"):
+    from rotas import home
+with perfil.medir("import:rotas.filmes"):
+    from rotas import filmes
+with perfil.medir("import:rotas.usuarios"):
+    from rotas import usuarios
+with perfil.medir("import:rotas.avaliacoes"):
+    from rotas import avaliacoes
+with perfil.medir("import:rotas.listaFavoritos"):
+    from rotas import listaFavoritos
+with perfil.medir("import:rotas.alteracoes"):
+    from rotas import alteracoes
+
+logger = logging.getLogger("mfmovies")
+
+INTERVALO_COMPACTACAO = 3600  # segundos entre compactações do feed de alterações
+INTERVALO_REAQUECIMENTO = 5  # segundos entre tentativas de aquecimento após uma falha
+
+def _compactar() -> None:
+    with get_session() as session:
+        compactar_alteracoes(session)
+
+async def compactar_periodicamente() -> None:
+    # Aguarda um intervalo antes da primeira compactação para não disputar o lock de escrita
+    # do SQLite com o aquecimento e o tráfego de cada worker recém-iniciado
+    while True:
+        await asyncio.sleep(INTERVALO_COMPACTACAO)
+        try:
+            await run_in_threadpool(_compactar)
+        except Exception:
+            logger.exception("Falha ao compactar o feed de alterações; nova tentativa em %s s", INTERVALO_COMPACTACAO)
+
+async def aquecer() -> None:
+    while True:
+        try:
+            with perfil.medir("lifespan:aquecimento"):
+                await run_in_threadpool(aquecer_banco)
+        except Exception as erro:
+            perfil.registrar_erro(erro)
+            logger.exception("Falha no aquecimento do banco; nova tentativa em %s s", INTERVALO_REAQUECIMENTO)
+            await asyncio.sleep(INTERVALO_REAQUECIMENTO)
+        else:
+            perfil.marcar_pronto()
+            return
 
 # Configurações de inicialização
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    with perfil.medir("lifespan:esquema"):
+        create_db_and_tables()
+    tarefas = [
+        asyncio.create_task(aquecer()),
+        asyncio.create_task(compactar_periodicamente()),
+    ]
     yield
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
 
 # Inicializa o aplicativo FastAPI
 app = FastAPI(lifespan=lifespan)
@@ -18,3 +83,4 @@ app.include_router(filmes.router)
 app.include_router(usuarios.router)
 app.include_router(avaliacoes.router)
 app.include_router(listaFavoritos.router)
+app.include_router(alteracoes.router)
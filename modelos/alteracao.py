@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+from sqlmodel import SQLModel, Field, Column, JSON
+
+class Alteracao(SQLModel, table=True):
+    # AUTOINCREMENT garante que a sequência nunca reutiliza IDs após a compactação
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq: int | None = Field(default=None, primary_key=True)
+    entidade: str = Field(index=True)
+    entidade_id: int
+    operacao: str
+    dados: dict = Field(default_factory=dict, sa_column=Column(JSON))
+    criado_em: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from sqlmodel import Session, SQLModel, col, select, delete
+from sqlalchemy import func
+import os
+from modelos.alteracao import Alteracao
+
+# Política de retenção do feed de alterações
+RETENCAO_DIAS = int(os.getenv("ALTERACOES_RETENCAO_DIAS", "7"))
+
+# Registra uma alteração na mesma transação da mutação (outbox transacional).
+# O commit fica a cargo de quem chama.
+def registrar_alteracao(session: Session, entidade: str, entidade_id: int | None, operacao: str, dados: SQLModel | dict) -> None:
+    if entidade_id is None:
+        raise ValueError("registrar_alteracao exige o ID da entidade (chamar session.flush() antes)")
+    if isinstance(dados, SQLModel):
+        dados = dados.model_dump(mode="json")
+    session.add(Alteracao(entidade=entidade, entidade_id=entidade_id, operacao=operacao, dados=dados))
+
+def listar_alteracoes(session: Session, since: int, limit: int) -> list[Alteracao]:
+    statement = select(Alteracao).where(col(Alteracao.seq) > since).order_by(col(Alteracao.seq)).limit(limit)
+    return list(session.exec(statement).all())
+
+# Retorna a menor sequência ainda disponível (None se o feed estiver vazio) e o head,
+# a maior sequência já registrada (0 se o feed estiver vazio)
+def obter_limites(session: Session) -> tuple[int | None, int]:
+    menor_seq, maior_seq = session.exec(select(func.min(Alteracao.seq), func.max(Alteracao.seq))).one()
+    return menor_seq, maior_seq or 0
+
+# Remove alterações mais antigas que a retenção, preservando sempre a mais recente
+# para que o cursor dos consumidores continue válido.
+def compactar_alteracoes(session: Session, retencao_dias: int = RETENCAO_DIAS) -> int:
+    limite = datetime.now(timezone.utc) - timedelta(days=retencao_dias)
+    maior_seq = session.exec(select(func.max(Alteracao.seq))).first()
+    if maior_seq is None:
+        return 0
+    resultado = session.exec(
+        delete(Alteracao).where((col(Alteracao.criado_em) < limite) & (col(Alteracao.seq) < maior_seq))
+    )
+    session.commit()
+    return resultado.rowcount
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from outbox import listar_alteracoes, obter_limites
+from database import get_session
+from modelos.alteracao import Alteracao
+
+router = APIRouter(prefix="/changes", tags=["Alterações"])
+
+# Contrato do feed:
+# - Para começar a sincronizar, o consumidor lê o head (GET /changes/head) ANTES de fazer a
+#   listagem completa (ex.: GET /filmes/) e depois consome /changes?since=<head>. Alterações
+#   feitas durante a listagem serão reenviadas pelo feed, que deve ser aplicado de forma idempotente.
+# - A resposta 410 (cursor compactado) também traz o head para retomar após a ressincronização.
+#   No stream, se a compactação alcançar um consumidor já conectado, ele recebe um evento
+#   "erro" com o mesmo conteúdo e a conexão é encerrada.
+# - Remover um filme ou uma lista gera um evento "remover_filme" para cada vínculo
+#   ListaFilmeLink apagado em cascata, antes do evento "deletar" da própria entidade.
+
+INTERVALO_SSE = 1.0  # segundos entre consultas ao outbox
+HEARTBEAT_SSE = 15.0  # segundos sem eventos até enviar um comentário de keep-alive
+
+MENSAGEM_COMPACTADO = "As alterações solicitadas já foram compactadas. Refaça a sincronização completa e retome a partir do head."
+
+def _verificar_cursor(session: Session, since: int) -> int:
+    """
+    Valida o cursor e retorna o head atual do feed.
+    """
+    menor_seq, head = obter_limites(session)
+    if since > head:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "mensagem": "O cursor informado é maior que o head do feed.",
+                "head": head,
+            },
+        )
+    if menor_seq is not None and since < menor_seq - 1:
+        raise HTTPException(
+            status_code=410,
+            detail={
+                "mensagem": MENSAGEM_COMPACTADO,
+                "head": head,
+            },
+        )
+    return head
+
+@router.get("/head", response_model=dict)
+def obter_head(session: Session = Depends(get_session)):
+    """
+    Retorna a maior sequência do feed. Deve ser lida antes da listagem completa
+    ao iniciar (ou refazer) a sincronização.
+    """
+    _, head = obter_limites(session)
+    return {"head": head}
+
+@router.get("/", response_model=dict)
+def listar_alteracoes_desde(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    session: Session = Depends(get_session),
+):
+    """
+    Retorna as alterações com sequência maior que `since`, em ordem.
+    """
+    head = _verificar_cursor(session, since)
+    alteracoes = listar_alteracoes(session, since, limit)
+    return {
+        "alteracoes": alteracoes,
+        "proximo": alteracoes[-1].seq if alteracoes else since,
+        "head": head,
+    }
+
+def _formatar_evento(alteracao: Alteracao) -> str:
+    dados = json.dumps(alteracao.model_dump(mode="json"), ensure_ascii=False)
+    return f"id: {alteracao.seq}\nevent: {alteracao.entidade}\ndata: {dados}\n\n"
+
+# Busca o próximo lote e, em seguida, os limites do feed. Como a menor sequência só cresce,
+# se ela ainda não passou do cursor após a busca, nenhuma alteração do lote foi compactada.
+def _buscar_lote(since: int, limit: int) -> tuple[list[Alteracao], int | None, int]:
+    with get_session() as session:
+        alteracoes = listar_alteracoes(session, since, limit)
+        menor_seq, head = obter_limites(session)
+        return alteracoes, menor_seq, head
+
+def _verificar_cursor_stream(since: int) -> int:
+    with get_session() as session:
+        return _verificar_cursor(session, since)
+
+@router.get("/stream")
+async def transmitir_alteracoes(
+    request: Request,
+    since: int = Query(0, ge=0),
+    last_event_id: int | None = Header(None),
+):
+    """
+    Transmite as alterações via Server-Sent Events a partir de `since`
+    (ou do cabeçalho `Last-Event-ID` ao reconectar).
+    """
+    cursor = last_event_id if last_event_id is not None else since
+    await run_in_threadpool(_verificar_cursor_stream, cursor)
+
+    async def eventos():
+        nonlocal cursor
+        ocioso = 0.0
+        while not await request.is_disconnected():
+            alteracoes, menor_seq, head = await run_in_threadpool(_buscar_lote, cursor, 100)
+            if menor_seq is not None and cursor < menor_seq - 1:
+                dados = json.dumps({"mensagem": MENSAGEM_COMPACTADO, "head": head}, ensure_ascii=False)
+                yield f"event: erro\ndata: {dados}\n\n"
+                return
+            for alteracao in alteracoes:
+                cursor = alteracao.seq
+                yield _formatar_evento(alteracao)
+            if alteracoes:
+                ocioso = 0.0
+                continue
+            if ocioso >= HEARTBEAT_SSE:
+                ocioso = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(INTERVALO_SSE)
+            ocioso += INTERVALO_SSE
+
+    return StreamingResponse(
+        eventos(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
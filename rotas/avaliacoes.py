@@ -2,6 +2,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 from sqlalchemy import func
+from outbox import registrar_alteracao
 from database import get_session
 from modelos.avaliacao import Avaliacao
 from modelos.filme import Filme
@@ -34,6 +35,8 @@ def criar_avaliacao(avaliacao: Avaliacao, session: Session = Depends(get_session
         )
 
     session.add(avaliacao)
+    session.flush()
+    registrar_alteracao(session, "avaliacao", avaliacao.id, "criar", avaliacao)
     session.commit()
     session.refresh(avaliacao)
 
@@ -69,6 +72,7 @@ def atualizar_avaliacao(avaliacao_id: int, avaliacao: Avaliacao, session: Sessio
     avaliacao_existente.comentario = avaliacao.comentario
     avaliacao_existente.usuario_id = avaliacao.usuario_id
     avaliacao_existente.filme_id = avaliacao.filme_id
+    registrar_alteracao(session, "avaliacao", avaliacao_id, "atualizar", avaliacao_existente)
     session.commit()
     session.refresh(avaliacao_existente)
     return avaliacao_existente
@@ -81,6 +85,7 @@ def deletar_avaliacao(avaliacao_id: int, session: Session = Depends(get_session)
     avaliacao = session.get(Avaliacao, avaliacao_id)
     if not avaliacao:
         raise HTTPException(status_code=404, detail="Avaliação não encontrada")
+    registrar_alteracao(session, "avaliacao", avaliacao_id, "deletar", avaliacao)
     session.delete(avaliacao)
     session.commit()
     return {"detail": "Avaliação deletada com sucesso"}
@@ -1,7 +1,9 @@
 from typing import List, Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session, select
+from outbox import registrar_alteracao
 from database import get_session
+from modelos.associacoes import ListaFilmeLink
 from modelos.filme import Filme
 
 router = APIRouter(prefix="/filmes", tags=["Filmes"])
@@ -12,6 +14,8 @@ def criar_filme(filme: Filme, session: Session = Depends(get_session)):
     Cria um novo filme.
     """
     session.add(filme)
+    session.flush()
+    registrar_alteracao(session, "filme", filme.id, "criar", filme)
     session.commit()
     session.refresh(filme)
     return filme
@@ -85,7 +89,8 @@ def atualizar_filme(filme_id: int, filme: Filme, session: Session = Depends(get_
     filme_existente.ano_lancamento = filme.ano_lancamento
     filme_existente.sinopse = filme.sinopse
     filme_existente.duracao = filme.duracao
-    filme_existente.generos = filme.genero
+    filme_existente.genero = filme.genero
+    registrar_alteracao(session, "filme", filme_id, "atualizar", filme_existente)
     session.commit()
     session.refresh(filme_existente)
     return filme_existente
@@ -98,6 +103,10 @@ def deletar_filme(filme_id: int, session: Session = Depends(get_session)):
     filme = session.get(Filme, filme_id)
     if not filme:
         raise HTTPException(status_code=404, detail="Filme não encontrado")
+    links = session.exec(select(ListaFilmeLink).where(ListaFilmeLink.filme_id == filme_id)).all()
+    for link in links:
+        registrar_alteracao(session, "listafavoritos", link.lista_favoritos_id, "remover_filme", link)
+    registrar_alteracao(session, "filme", filme_id, "deletar", filme)
     session.delete(filme)
     session.commit()
     return {"detail": "Filme deletado com sucesso"}
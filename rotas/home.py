@@ -1,4 +1,6 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from inicializacao import perfil
 
 router = APIRouter(
     prefix="",  # Prefixo para todas as rotas
@@ -9,3 +11,8 @@ router = APIRouter(
 @router.get("/")
 async def root():
     return {"msg": "Bem-vindo ao MF Movies!"}
+
+# Prontidão: só responde 200 após o aquecimento do banco
+@router.get("/ready")
+async def pronto():
+    return JSONResponse(status_code=200 if perfil.pronto else 503, content=perfil.relatorio())
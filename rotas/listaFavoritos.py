@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func
 from sqlmodel import Session, select
+from outbox import registrar_alteracao
 from database import get_session
 from modelos.associacoes import ListaFilmeLink
 from modelos.filme import Filme
@@ -22,6 +23,8 @@ def criar_lista(lista: ListaFavoritos, session: Session = Depends(get_session)):
     if not usuario_existente:
         raise HTTPException(status_code=404, detail="Usuário não encontrado.")
     session.add(lista)
+    session.flush()
+    registrar_alteracao(session, "listafavoritos", lista.id, "criar", lista)
     session.commit()
     session.refresh(lista)
     return lista
@@ -52,6 +55,7 @@ def atualizar_lista(lista_id: int, lista: ListaFavoritos, session: Session = Dep
     if not lista_existente:
         raise HTTPException(status_code=404, detail="Lista de favoritos não encontrada")
     lista_existente.nome = lista.nome
+    registrar_alteracao(session, "listafavoritos", lista_id, "atualizar", lista_existente)
     session.commit()
     session.refresh(lista_existente)
     return lista_existente
@@ -64,6 +68,10 @@ def deletar_lista(lista_id: int, session: Session = Depends(get_session)):
     lista = session.get(ListaFavoritos, lista_id)
     if not lista:
         raise HTTPException(status_code=404, detail="Lista de favoritos não encontrada")
+    links = session.exec(select(ListaFilmeLink).where(ListaFilmeLink.lista_favoritos_id == lista_id)).all()
+    for link in links:
+        registrar_alteracao(session, "listafavoritos", lista_id, "remover_filme", link)
+    registrar_alteracao(session, "listafavoritos", lista_id, "deletar", lista)
     session.delete(lista)
     session.commit()
     return {"detail": "Lista de favoritos deletada com sucesso"}
@@ -88,6 +96,7 @@ def adicionar_filme_lista(lista_id: int, filme_id: int, session: Session = Depen
 
     novo_link = ListaFilmeLink(lista_favoritos_id=lista_id, filme_id=filme_id)
     session.add(novo_link)
+    registrar_alteracao(session, "listafavoritos", lista_id, "adicionar_filme", novo_link)
     session.commit()
     session.refresh(novo_link)
 
@@ -111,6 +120,7 @@ def remover_filme_lista(lista_id: int, filme_id: int, session: Session = Depends
     if not filme_na_lista:
         raise HTTPException(status_code=404, detail="O filme não está na lista de favoritos.")
 
+    registrar_alteracao(session, "listafavoritos", lista_id, "remover_filme", filme_na_lista)
     session.delete(filme_na_lista)
     session.commit()
 
@@ -1,6 +1,7 @@
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends
 from sqlmodel import Session, select
+from outbox import registrar_alteracao
 from database import get_session
 from modelos.avaliacao import Avaliacao
 from modelos.filme import Filme
@@ -20,6 +21,8 @@ def criar_usuario(usuario: Usuario, session: Session = Depends(get_session)):
     if email_existente:
         raise HTTPException(status_code=400, detail="Endereço de e-mail já utilizado")
     session.add(usuario)
+    session.flush()
+    registrar_alteracao(session, "usuario", usuario.id, "criar", usuario)
     session.commit()
     session.refresh(usuario)
     return usuario
@@ -54,6 +57,7 @@ def atualizar_usuario(usuario_id: int, usuario: Usuario, session: Session = Depe
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
     usuario_existente.nome = usuario.nome
     usuario_existente.email = usuario.email
+    registrar_alteracao(session, "usuario", usuario_id, "atualizar", usuario_existente)
     session.commit()
     session.refresh(usuario_existente)
     return usuario_existente
@@ -66,6 +70,7 @@ def deletar_usuario(usuario_id: int, session: Session = Depends(get_session)):
     usuario = session.get(Usuario, usuario_id)
     if not usuario:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
+    registrar_alteracao(session, "usuario", usuario_id, "deletar", usuario)
     session.delete(usuario)
     session.commit()
     return {"detail": "Usuário deletado com sucesso"}